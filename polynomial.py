@@ -1,32 +1,106 @@
 from exceptions import PolynomialParseError, PolynomialTypeError, PolynomialDomainError
-from typing import Union
+from collections import defaultdict
+from functools import lru_cache
+from types import ModuleType
+from typing import Callable, Union
+import re
+import sys
+
+import numpy as np
+import numpy.typing as npt
 
 __version__ = "1.0.0"
 
 Scalar = Union[int, float]
 
+_INT64_LIMIT = 2 ** 63
+_FLOAT_EXACT_LIMIT = 2 ** 53
+_FFT_THRESHOLD = 512
+_FFT_EXACT_LIMIT = 2 ** 42
+_NUMBA_THRESHOLD = 10_000
+_SPECIALIZE_MAX_DEGREE = 64
+_ESTRIN_MIN_DEGREE = 16
+_ESTRIN_MAX_POINTS = 128
+
+_prange = range
+_horner_batch = None
+
+def _horner_loop(coefficients: np.ndarray, x: np.ndarray, out: np.ndarray) -> None:
+    """
+    Evaluates a polynomial at every point of a 1-D array in a single fused, parallel pass.
+    """
+    for i in _prange(x.size):
+        result = coefficients[coefficients.size - 1]
+        for j in range(coefficients.size - 2, -1, -1):
+            result = result * x[i] + coefficients[j]
+        out[i] = result
+
+def _numba_horner() -> Union[Callable[[np.ndarray, np.ndarray, np.ndarray], None], None]:
+    """
+    Returns the Numba-compiled _horner_loop, importing Numba and compiling it on first use.
+    The compiled kernel is cached on disk, and None is returned if Numba is not installed.
+    """
+    global _horner_batch, _prange
+    if _horner_batch is None:
+        try:
+            from numba import njit, prange as _prange
+        except ImportError:
+            _horner_batch = False
+        else:
+            _horner_batch = njit(parallel=True, fastmath=True, cache=True)(_horner_loop)
+    return _horner_batch or None
+
 class Polynomial:
     """
     Represents a univariate polynomial with real coefficients.
     """
 
-    def __init__(self, *args: Scalar, var: str = "x") -> None:
+    __slots__ = ("_coefficients", "_var", "_arr", "_arr_gpu", "_hash", "_str", "_compiled_eval", "__weakref__")
+
+    def __init__(self, *args: Scalar, var: str = "x", dtype: npt.DTypeLike = None) -> None:
         """
         Initialises a polynomial from its coefficients.
 
         Example: Polynomial(1, 0, -3) -> 1 - 3x^2
         Terms are in ascending order of powers.
-        """
-        self._coefficients = self._clean(self._strip_leading_zeros(args))
+        A floating point dtype such as np.float32 stores the coefficients used for arithmetic and evaluation
+        at that precision, halving memory traffic on large arrays at the cost of accuracy.
+        The coefficients tuple keeps the exact values given, so equality and hashing are unaffected.
+        """
+        self._arr = self._trimmed(self._as_array(args))
+        self._coefficients = None
+        if dtype is not None:
+            exact = [co.item() if isinstance(co, np.generic) else co for co in args[:self._arr.size]]
+            self._coefficients = self._clean(exact or (0,))
+            self._arr = self._reduced(self._arr, dtype)
         self._var = var
-        if not self._is_valid_coefficients(self.coefficients):
-            raise ValueError("Polynomial coefficients must be real numbers")
+        self._arr_gpu = None
+        self._compiled_eval = None
+        self._hash = None
+        self._str = None
+
+    @classmethod
+    def _from_array(cls, arr: np.ndarray, var: str = "x") -> "Polynomial":
+        """
+        Builds a polynomial directly from a coefficient array, without re-validating it.
+        """
+        polynomial = cls.__new__(cls)
+        polynomial._coefficients = None
+        polynomial._var = var
+        polynomial._arr = cls._trimmed(arr)
+        polynomial._arr_gpu = None
+        polynomial._compiled_eval = None
+        polynomial._hash = None
+        polynomial._str = None
+        return polynomial
 
     @property
     def coefficients(self) -> tuple[Scalar, ...]:
         """
-        Returns the tuple of coefficients.
+        Returns the tuple of coefficients, built from the coefficient array on first access.
         """
+        if self._coefficients is None:
+            self._coefficients = self._clean(self._arr.tolist())
         return self._coefficients
 
     @property
@@ -44,6 +118,7 @@ class Polynomial:
         if not isinstance(new, str):
             raise TypeError("Polynomial variable must be a string")
         self._var = new
+        self._str = None
 
     @property
     def degree(self) -> int:
@@ -56,6 +131,8 @@ class Polynomial:
         """
         Returns a human-readable algebraic representation.
         """
+        if self._str is not None:
+            return self._str
         result = ""
         nonzero_found = False
         for i in range(len(self.coefficients)):
@@ -75,7 +152,8 @@ class Polynomial:
                 result += f"{plus}{coefficient}{self.var}"
             else:
                 result += f"{plus}{coefficient}{self.var}^{i}"
-        return result or "0"
+        self._str = result or "0"
+        return self._str
 
     def __repr__(self) -> str:
         """
@@ -83,11 +161,27 @@ class Polynomial:
         """
         return f"Polynomial({', '.join([str(i) for i in self.coefficients])}, var=\"{self.var}\")"
 
+    def __getstate__(self) -> tuple:
+        """
+        Pickles the polynomial by its coefficients and variable, leaving out cached values.
+        """
+        return self._coefficients, self._arr, self._var
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Restores a pickled polynomial.
+        """
+        self._coefficients, self._arr, self._var = state
+        self._arr_gpu = None
+        self._compiled_eval = None
+        self._hash = None
+        self._str = None
+
     def __len__(self) -> int:
         """
         Returns the number of terms (degree + 1).
         """
-        return len(self.coefficients)
+        return self._arr.size
 
     def __eq__(self, other: object) -> bool:
         """
@@ -103,19 +197,20 @@ class Polynomial:
         """
         Allows use of Polynomial as dict keys or set elements.
         """
-        return hash(tuple(self.coefficients))
+        if self._hash is None:
+            self._hash = hash(self.coefficients)
+        return self._hash
 
     def __add__(self, other: Union[Scalar, "Polynomial"]) -> "Polynomial":
         """
         Adds a scalar or another Polynomial.
         """
         if Polynomial._is_numeric(other):
-            return Polynomial(self.coefficients[0] + other, *self.coefficients[1:])
+            arr = self._exact(self._arr, 1, other)
+            return Polynomial._from_array(np.concatenate((arr[:1] + other, arr[1:])), var=self.var)
         if isinstance(other, Polynomial):
-            shorter, longer = sorted([self, other], key=len)
-            diff = abs(len(self) - len(other))
-            shorter_coefficients = shorter.coefficients + [0] * diff
-            return Polynomial(*[co1 + co2 for co1, co2 in zip(shorter_coefficients, longer.coefficients)], var=self.var)
+            a, b = self._padded(self._exact(self._arr, 1, self._magnitude(other._arr)), other._arr)
+            return Polynomial._from_array(a + b, var=self.var)
         raise PolynomialTypeError("add", other)
 
     def __radd__(self, other: Scalar) -> "Polynomial":
@@ -128,26 +223,28 @@ class Polynomial:
         """
         Subtracts a scalar or another Polynomial.
         """
-        return self + -other
+        if isinstance(other, Polynomial):
+            a, b = self._padded(self._exact(self._arr, 1, self._magnitude(other._arr)), other._arr)
+            return Polynomial._from_array(a - b, var=self.var)
+        if Polynomial._is_numeric(other):
+            arr = self._exact(self._arr, 1, other)
+            return Polynomial._from_array(np.concatenate((arr[:1] - other, arr[1:])), var=self.var)
+        raise PolynomialTypeError("subtract", other)
 
     def __neg__(self) -> "Polynomial":
         """
         Returns the negated polynomial (-self).
         """
-        return Polynomial(*[-x for x in self.coefficients], var=self.var)
+        return Polynomial._from_array(-self._exact(self._arr, -1), var=self.var)
 
     def __mul__(self, other: Union[Scalar, "Polynomial"]) -> "Polynomial":
         """
         Multiplies by a scalar or another polynomial.
         """
         if Polynomial._is_numeric(other):
-            return Polynomial(*[co * other for co in self.coefficients], var=self.var)
+            return Polynomial._from_array(self._exact(self._arr, other) * other, var=self.var)
         if isinstance(other, Polynomial):
-            new_coefficients = [0] * (len(self) + len(other) - 1)
-            for i in range(len(self.coefficients)):
-                for j in range(len(other.coefficients)):
-                    new_coefficients[i + j] += self.coefficients[i] * other.coefficients[j]
-            return Polynomial(*new_coefficients, var=self.var)
+            return Polynomial._from_array(self._convolve(self._arr, other._arr), var=self.var)
         raise PolynomialTypeError("multiply", other)
 
     def __rmul__(self, other: Scalar) -> "Polynomial":
@@ -161,7 +258,9 @@ class Polynomial:
         Divides by a scalar.
         """
         if Polynomial._is_numeric(other):
-            return Polynomial(*[co / other for co in self.coefficients], var=self.var)
+            if other == 0:
+                raise ZeroDivisionError("division by zero")
+            return Polynomial._from_array(self._arr / other, var=self.var)
         raise PolynomialTypeError("divide", other)
 
     def __pow__(self, n: int) -> "Polynomial":
@@ -170,38 +269,127 @@ class Polynomial:
         """
         if not isinstance(n, int) or n < 0:
             raise PolynomialDomainError("Cannot raise polynomial to negative power")
-        result = Polynomial(1, var=self.var)
-        for _ in range(n):
-            result *= self
+        result = Polynomial._from_array(np.ones(1, dtype=self._arr.dtype), var=self.var)
+        base = self
+        while n:
+            if n & 1:
+                result *= base
+            n >>= 1
+            if n:
+                base *= base
         return result
 
-    def evaluate(self, n: Scalar) -> Scalar:
+    def evaluate(self, n: Union[Scalar, np.ndarray]) -> Union[Scalar, np.ndarray]:
+        """
+        Evaluates the polynomial at a number n using Horner's scheme.
+        If n is a NumPy array, it is evaluated element-wise in one vectorised pass,
+        or with a Numba kernel for large real arrays when Numba is installed.
+        High-degree polynomials at only a few points use Estrin's scheme instead.
+        CuPy arrays are evaluated on the GPU.
+        """
+        if isinstance(n, np.ndarray):
+            dtype = np.result_type(n, self._arr.dtype if self._arr.dtype.kind == "f" else np.float64)
+            if n.size >= _NUMBA_THRESHOLD and n.dtype.kind in "iuf" and dtype in (np.float32, np.float64):
+                kernel = _numba_horner()
+                if kernel is not None:
+                    points = np.ascontiguousarray(n.ravel(), dtype=dtype)
+                    result = np.empty(points.size, dtype=dtype)
+                    kernel(self._arr.astype(dtype), points, result)
+                    return result.reshape(n.shape)
+            if self.degree >= _ESTRIN_MIN_DEGREE and n.size <= _ESTRIN_MAX_POINTS:
+                return self._estrin(n, dtype)
+            result = np.full_like(n, self._arr[-1], dtype=dtype)
+            for co in self._arr[-2::-1]:
+                result *= n
+                result += co
+            return result
+        if not isinstance(n, (int, float)):
+            cupy = sys.modules.get("cupy")
+            if cupy is not None and isinstance(n, cupy.ndarray):
+                return self._evaluate_gpu(n, cupy)
+        coefficients = self.coefficients
+        if len(coefficients) > _SPECIALIZE_MAX_DEGREE + 1:
+            result = coefficients[-1]
+            for co in reversed(coefficients[:-1]):
+                result = result * n + co
+            return result
+        if self._compiled_eval is None:
+            self._compiled_eval = self._compile_evaluate()
+        return self._compiled_eval(n)
+
+    def _evaluate_gpu(self, n: "cupy.ndarray", cupy: ModuleType) -> "cupy.ndarray":
         """
-        Evaluates the polynomial at a number n.
+        Evaluates the polynomial at a CuPy array with Horner's scheme, running every step on the device.
+        The coefficients are copied to the GPU once and cached for later calls.
         """
-        return sum(self.coefficients[i] * n ** i for i in range(len(self)))
+        if self._arr_gpu is None:
+            self._arr_gpu = cupy.asarray(self._arr if self._arr.dtype.kind == "f" else self._arr.astype(np.float64))
+        result = cupy.full_like(n, self._arr_gpu[-1], dtype=cupy.result_type(n, self._arr_gpu))
+        for co in self._arr_gpu[-2::-1]:
+            result *= n
+            result += co
+        return result
+
+    def _estrin(self, n: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        """
+        Evaluates the polynomial at an array of points using Estrin's scheme.
+        Each level pairs up the previous level's sub-polynomials in one broadcast operation on x, x^2, x^4, ...,
+        so it takes log2(degree) array operations instead of Horner's degree, with a (degree / 2) x n.size temporary.
+        An unpaired last sub-polynomial is carried to the next level as is, rather than paired with zeros.
+        """
+        level = self._arr.astype(dtype).reshape((-1,) + (1,) * n.ndim)
+        power = n.astype(dtype, copy=False)
+        while True:
+            paired = level[0:len(level) - 1:2] + level[1::2] * power
+            if len(level) % 2:
+                paired = np.concatenate((paired, np.broadcast_to(level[-1:], (1,) + paired.shape[1:])))
+            level = paired
+            if len(level) == 1:
+                return level[0, ...]
+            power = power * power
+
+    def _compile_evaluate(self) -> Callable[[Scalar], Scalar]:
+        """
+        Generates a straight-line Horner function with this polynomial's coefficients inlined as literals.
+        It is seeded from the leading coefficient rather than 0 * x, which would be nan at infinite points.
+        """
+        literals = [repr(int(co) if isinstance(co, (int, np.integer)) else float(co)) for co in self.coefficients]
+        if len(literals) == 1:
+            lines = ["def evaluate(x):", f"    result = {literals[0]} * x ** 0"]
+        else:
+            lines = ["def evaluate(x):", f"    result = {literals[-1]} * x + {literals[-2]}"]
+            lines += [f"    result = result * x + {literal}" for literal in reversed(literals[:-2])]
+        lines.append("    return result")
+        namespace = {"inf": float("inf"), "nan": float("nan")}
+        exec(compile("\n".join(lines), "<horner>", "exec"), namespace)
+        return namespace["evaluate"]
 
     def copy(self) -> "Polynomial":
         """
         Returns a deep copy of the polynomial.
         """
-        return Polynomial(*self.coefficients, var=self.var)
+        polynomial = Polynomial._from_array(self._arr.copy(), var=self.var)
+        polynomial._coefficients = self._coefficients
+        return polynomial
 
     def derivative(self) -> "Polynomial":
         """
         Returns the first derivative of the polynomial.
         """
-        if len(self.coefficients) == 1:
-            return Polynomial(0)
-        differentiated = [i * co for i, co in enumerate(self.coefficients)][1:]
-        return Polynomial(*differentiated, var=self.var)
+        if self._arr.size == 1:
+            return Polynomial._from_array(np.zeros(1, dtype=self._arr.dtype), var=self.var)
+        arr = self._exact(self._arr, self._arr.size - 1)
+        return Polynomial._from_array(arr[1:] * np.arange(1, arr.size, dtype=arr.dtype), var=self.var)
 
     def integral(self, constant: Scalar = 0) -> "Polynomial":
         """
         Returns the indefinite integral with an optional constant.
         """
-        integrated = [constant] + [self.coefficients[i] / (i + 1) for i in range(len(self.coefficients))]
-        return Polynomial(*integrated, var=self.var)
+        if not Polynomial._is_numeric(constant):
+            raise ValueError("Polynomial coefficients must be real numbers")
+        integrated = self._arr / np.arange(1, self._arr.size + 1, dtype=self._arr.dtype)
+        constant = np.array([constant], dtype=integrated.dtype)
+        return Polynomial._from_array(np.concatenate((constant, integrated)), var=self.var)
 
     def compose(self, other: "Polynomial") -> "Polynomial":
         """
@@ -209,79 +397,216 @@ class Polynomial:
         """
         if not isinstance(other, Polynomial):
             raise PolynomialTypeError("compose", other)
-        result = Polynomial(0, var=self.var)
-        for i in range(len(self.coefficients)):
-            result += self.coefficients[i] * other**i
+        result = Polynomial._from_array(self._arr[-1:], var=self.var)
+        for co in self._arr[-2::-1]:
+            result = result * other + co
         return result
 
     @staticmethod
     def from_roots(*args: Scalar, var: str = "x") -> "Polynomial":
         """
         Constructs a polynomial from its roots.
-        """
-        result = Polynomial(1, var=var)
-        for root in args:
-            result *= Polynomial(-root, 1, var=var)
-        return result
+        The linear factors are multiplied pairwise, tournament-style, directly on coefficient arrays.
+        Float roots always use the direct convolution, as FFT noise would swamp the small coefficients.
+        """
+        if not args:
+            return Polynomial(1, var=var)
+        roots = Polynomial._exact(Polynomial._as_array(args), -1)
+        convolve = np.convolve if roots.dtype.kind == "f" else Polynomial._convolve
+        factors = list(np.column_stack((-roots, np.ones_like(roots))))
+        while len(factors) > 1:
+            paired = [convolve(a, b) for a, b in zip(factors[0::2], factors[1::2])]
+            factors = paired + factors[len(paired) * 2:]
+        return Polynomial._from_array(factors[0], var=var)
 
     @staticmethod
     def from_string(string: str, var: str = "x") -> "Polynomial":
         """
         Parses a string like "x^2 - 3x + 2" into a Polynomial object.
         """
-        if string.startswith("-"):
-            string = "0" + string
-        string = string.replace(" ", "").replace("+-", "_").replace("-", "+-").replace("_", "+-")
-        terms = string.split("+")
-        coefficients = {}
-        for term in terms:
-            if Polynomial._is_valid_term(term, var):
-                coefficient, exponent = Polynomial._is_valid_term(term, var)
-                if coefficients.get(exponent):
-                    coefficients[exponent] += coefficient
-                else:
-                    coefficients[exponent] = coefficient
-            else:
-                raise PolynomialParseError(term)
-        degree = max(coefficients)
-        final_coefficients = [0] * (degree + 1)
-        for i in range(degree + 1):
-            if coefficients.get(i):
-                final_coefficients[i] = coefficients[i]
+        string = "".join(string.split())
+        pattern = Polynomial._term_pattern(var)
+        coefficients = defaultdict(float)
+        position = 0
+        while position < len(string):
+            match = pattern.match(string, position)
+            if match is None or not (match.group(2) or match.group(3)):
+                raise PolynomialParseError(re.match(r"[+-]?[^+-]*", string[position:]).group())
+            sign, number, variable, exponent = match.groups()
+            coefficient = float(number) if number else 1.0
+            exponent = int(exponent) if exponent else int(bool(variable))
+            coefficients[exponent] += -coefficient if sign == "-" else coefficient
+            position = match.end()
+        if not coefficients:
+            raise PolynomialParseError(string)
+        final_coefficients = np.zeros(max(coefficients) + 1)
+        final_coefficients[list(coefficients)] = list(coefficients.values())
         return Polynomial(*final_coefficients, var=var)
 
     @staticmethod
-    def _is_valid_term(term: str, var: str) -> Union[tuple[Scalar, int], bool]:
+    @lru_cache(maxsize=None)
+    def _term_pattern(var: str) -> re.Pattern:
         """
-        Parses a term like '3x^2' into (coefficient, exponent), or returns False if invalid.
+        Compiles the pattern matching one signed term like '-3.5x^2' of a whitespace-free polynomial string.
         """
-        try:
-            single = float(term)
-            return single, 0
-        except:
-            pass
-        check = term.split(f"{var}^")
-        if check[0] == "":
-            check[0] = 1
-        elif check[0] == "-":
-            check[0] = -1
-        if len(check) != 2:
-            if "^" not in term:
+        number = r"(\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)"
+        return re.compile(rf"([+-])?{number}?(?:\*?({re.escape(var)})(?:\^(\d+))?)?(?=[+-]|$)")
+
+    @staticmethod
+    def _trimmed(arr: np.ndarray) -> np.ndarray:
+        """
+        Removes zero coefficients of the highest powers, keeping at least one term.
+        Only the last coefficient is read when it is already non-zero.
+        """
+        if arr.size == 0:
+            return np.zeros(1, dtype=arr.dtype)
+        if arr[-1] == 0:
+            nonzero = np.flatnonzero(arr)
+            arr = arr[:nonzero[-1] + 1 if nonzero.size else 1]
+        return arr
+
+    @staticmethod
+    def _clean(coefficients: Union[tuple[Scalar, ...], list[Scalar]]) -> tuple[Scalar, ...]:
+        """
+        Converts integral float coefficients to ints, so 2.0 is stored and printed as 2.
+        """
+        return tuple(int(co) if isinstance(co, float) and co.is_integer() else co for co in coefficients)
+
+    @staticmethod
+    def _is_numeric(obj: object) -> bool:
+        """
+        Checks whether an object is a real scalar (bools are rejected).
+        """
+        return isinstance(obj, (int, float, np.integer, np.floating)) and not isinstance(obj, bool)
+
+    @staticmethod
+    def _is_valid_coefficients(arr: np.ndarray) -> bool:
+        """
+        Checks that a coefficient array holds only finite real numbers.
+        """
+        return arr.dtype.kind in "iO" or (arr.dtype.kind == "f" and bool(np.isfinite(arr).all()))
+
+    @staticmethod
+    def _as_array(coefficients: tuple[Scalar, ...]) -> np.ndarray:
+        """
+        Converts coefficients to an int64 array if they are all integers, or a float64 array otherwise.
+        Integers outside the int64 range, or integers beyond float precision mixed with floats,
+        are kept as Python ints in an object array.
+        Raises ValueError unless every coefficient is a finite real number.
+        """
+        types = set(map(type, coefficients))
+        if not all(issubclass(t, (int, float, np.integer, np.floating)) and not issubclass(t, bool) for t in types):
+            raise ValueError("Polynomial coefficients must be real numbers")
+        arr = np.asarray(coefficients)
+        kind = arr.dtype.kind
+        mixed = kind in "fO" and not all(issubclass(t, (float, np.floating)) for t in types)
+        if kind in "uO" or (mixed and arr.size and not np.abs(arr).max() < _FLOAT_EXACT_LIMIT):
+            if not mixed:
                 try:
-                    sign = 1
-                    if term[0] == "-":
-                        sign = -1
-                        term = term[1:]
-                        if len(term) == 1:
-                            return -1, 1
-                    coefficient = float(term[:-1])
-                    return sign * coefficient, 1
-                except:
-                    pass
-            return False
+                    arr = np.array(coefficients, dtype=np.int64)
+                except OverflowError:
+                    arr = np.array(coefficients, dtype=object)
+            elif all(abs(co) < _FLOAT_EXACT_LIMIT for co in coefficients if isinstance(co, (int, np.integer))):
+                arr = np.array(coefficients, dtype=np.float64)
+            elif all(np.isfinite(co) for co in coefficients if isinstance(co, (float, np.floating))):
+                arr = np.array([int(co) if isinstance(co, np.integer) else co for co in coefficients], dtype=object)
+            else:
+                raise ValueError("Polynomial coefficients must be real numbers")
+        elif kind == "i":
+            arr = arr.astype(np.int64, copy=False)
+        elif kind == "f":
+            arr = arr.astype(np.float64, copy=False)
+        if not Polynomial._is_valid_coefficients(arr):
+            raise ValueError("Polynomial coefficients must be real numbers")
+        return arr
+
+    @staticmethod
+    def _reduced(arr: np.ndarray, dtype: npt.DTypeLike) -> np.ndarray:
+        """
+        Casts a coefficient array to a floating point dtype, raising ValueError if a coefficient overflows it.
+        """
+        if np.dtype(dtype).kind != "f":
+            raise ValueError("Polynomial dtype must be a floating point type")
+        message = f"Polynomial coefficients must be finite in {np.dtype(dtype).name}"
         try:
-            coefficient = float(check[0])
-            exponent = int(check[1])
-        except:
-            return False
-        return coefficient, exponent
+            with np.errstate(over="ignore"):
+                reduced = arr.astype(dtype)
+        except OverflowError:
+            raise ValueError(message) from None
+        if not Polynomial._is_valid_coefficients(reduced):
+            raise ValueError(message)
+        return reduced
+
+    @staticmethod
+    def _magnitude(arr: np.ndarray) -> int:
+        """
+        Returns the largest absolute coefficient of an int64 array, or 0 for any other dtype.
+        """
+        if arr.dtype != np.int64:
+            return 0
+        return max(-int(arr.min()), int(arr.max()))
+
+    @staticmethod
+    def _exact(arr: np.ndarray, scale: Scalar = 1, offset: Scalar = 0) -> np.ndarray:
+        """
+        Returns arr as Python ints if computing arr * scale + offset could overflow int64, else arr itself.
+        """
+        if arr.dtype != np.int64 or not isinstance(scale, (int, np.integer)) or not isinstance(offset, (int, np.integer)):
+            return arr
+        scale, offset = abs(int(scale)), abs(int(offset))
+        if max(Polynomial._magnitude(arr) * scale + offset, scale, offset) >= _INT64_LIMIT:
+            return arr.astype(object)
+        return arr
+
+    @staticmethod
+    def _padded(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Zero-pads the shorter of two coefficient arrays to the length of the longer one.
+        """
+        if len(a) < len(b):
+            a = np.concatenate((a, np.zeros(len(b) - len(a), dtype=a.dtype)))
+        elif len(b) < len(a):
+            b = np.concatenate((b, np.zeros(len(a) - len(b), dtype=b.dtype)))
+        return a, b
+
+    @staticmethod
+    def _convolve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Multiplies two coefficient arrays, through the FFT once both have at least _FFT_THRESHOLD terms.
+        Products of integer-valued coefficients, including integral floats, are rounded back to integers
+        while they stay well within float64 precision; larger integer-valued products use the direct
+        convolution (multi-prime CRT would be the exact FFT). Other float products are accurate relative to the largest
+        coefficient of the product, not to each coefficient, so coefficients many orders of magnitude below
+        it are left as noise where np.convolve would be accurate to rounding.
+        """
+        shortest = min(len(a), len(b))
+        if shortest >= _FFT_THRESHOLD and object not in (a.dtype, b.dtype):
+            bound = Polynomial._integer_bound(a) * Polynomial._integer_bound(b) * shortest
+            if bound < _FFT_EXACT_LIMIT:
+                return np.rint(Polynomial._fft_convolve(a, b)).astype(np.result_type(a, b))
+            if bound == float("inf"):
+                return Polynomial._fft_convolve(a, b).astype(np.result_type(a, b), copy=False)
+        return np.convolve(Polynomial._exact(a, Polynomial._magnitude(b) * shortest), b)
+
+    @staticmethod
+    def _integer_bound(arr: np.ndarray) -> float:
+        """
+        Returns the largest absolute coefficient if every coefficient is an integer, or inf otherwise.
+        """
+        if arr.dtype == np.int64:
+            return float(Polynomial._magnitude(arr))
+        if not np.array_equal(np.rint(arr), arr):
+            return float("inf")
+        return float(np.abs(arr).max())
+
+    @staticmethod
+    def _fft_convolve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Convolves two real arrays in O((n + m) log(n + m)) using the real FFT.
+        Both operands are scaled to a largest coefficient of 1 first, so large products do not overflow.
+        """
+        n = len(a) + len(b) - 1
+        size = 1 << (n - 1).bit_length()
+        scale_a, scale_b = float(np.abs(a).max()) or 1.0, float(np.abs(b).max()) or 1.0
+        product = np.fft.irfft(np.fft.rfft(a / scale_a, size) * np.fft.rfft(b / scale_b, size), size)[:n]
+        return product * scale_a * scale_b